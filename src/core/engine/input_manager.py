@@ -35,6 +35,17 @@ DEFAULT_KEY_BINDINGS = {
     }
 }
 
+# ===========================================================
+# Precomputed Keyboard Directions
+# ===========================================================
+# Keyboard movement only ever produces x, y in {-1, 0, 1}, so each
+# normalized direction is built once here instead of every frame.
+KEYBOARD_DIRECTIONS = {
+    (x, y): pygame.Vector2(x, y).normalize() if (x or y) else pygame.Vector2(0, 0)
+    for x in (-1, 0, 1)
+    for y in (-1, 0, 1)
+}
+
 class InputManager:
     """Processes player input from keyboard and (optionally) controllers."""
 
@@ -51,6 +62,7 @@ class InputManager:
         """
         self.key_bindings = key_bindings or DEFAULT_KEY_BINDINGS
         self.context = "gameplay"  # active context ("gameplay" or "ui")
+        self._active_bindings = self.key_bindings.get(self.context, {})
 
         DebugLogger.init("║{:<59}║".format(f"\t[InputManager][INIT]\t→  Initialized"), show_meta=False)
 
@@ -68,6 +80,7 @@ class InputManager:
         self.move = pygame.Vector2(0, 0)
         self._move_keyboard = pygame.Vector2(0, 0)
         self._move_controller = pygame.Vector2(0, 0)
+        self._keyboard_dir = (0, 0)
 
         # Action states (gameplay)
         self.attack_pressed = False
@@ -93,6 +106,7 @@ class InputManager:
             DebugLogger.warn(f"Unknown context: {name}")
             return
         self.context = name
+        self._active_bindings = self.key_bindings[name]
         DebugLogger.state(f"Context switched to [{name.upper()}]")
 
     def get_context(self):
@@ -124,6 +138,7 @@ class InputManager:
         y = int(down) - int(up)
 
         self._move_keyboard.update(x, y)
+        self._keyboard_dir = (x, y)
 
         # Actions
         self.attack_pressed = self._is_pressed("attack", keys)
@@ -213,10 +228,7 @@ class InputManager:
         Returns:
             bool: True if any key bound to the action is pressed.
         """
-        ctx = self.key_bindings.get(self.context, {})
-        if action not in ctx:
-            return False
-        for key in ctx[action]:
+        for key in self._active_bindings.get(action, ()):
             if keys[key]:
                 return True
         return False
@@ -228,7 +240,13 @@ class InputManager:
         Returns:
             pygame.Vector2: Normalized direction vector.
                 Returns (0, 0) if no movement input is active.
+
+        Notes:
+            Keyboard directions come from the shared KEYBOARD_DIRECTIONS
+            table and must be treated as read-only.
         """
+        if self.move is self._move_keyboard:
+            return KEYBOARD_DIRECTIONS[self._keyboard_dir]
         if self.move.length_squared() > 0:
             return self.move.normalize()
         return pygame.Vector2(0, 0)
\ No newline at end of file
@@ -12,6 +12,8 @@ Responsibilities
 - Maintain a global DebugHUD independent of scenes
 """
 
+import time
+
 import pygame
 
 from src.core.settings import Display, Physics, Debug, Layers
@@ -177,7 +179,6 @@ class GameLoop:
     # ===========================================================
     def _draw(self):
         """Draw everything managed by the active scene."""
-        import time
         start = time.perf_counter()
 
         game_surface = self.display.get_game_surface()
@@ -63,6 +63,7 @@ class Player:
 class Debug:
     VERBOSE_ENTITY_INIT = False
     VERBOSE_ENTITY_DEATH = False
+    VERBOSE_ENTITY_DAMAGE = False
     TRACE_UPDATES = False
     STAGE_SUMMARY = True
     SHOW_HITBOXES = False
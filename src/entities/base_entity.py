@@ -19,6 +19,9 @@ from src.core.utils.debug_logger import DebugLogger
 class BaseEntity:
     """Common interface for all entities within the game world."""
 
+    # Fixed attribute layout; subclasses must declare their own __slots__
+    __slots__ = ("image", "rect", "alive", "layer")
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -50,7 +53,8 @@ class BaseEntity:
         """
         # Base class provides no movement or logic.
         # Subclasses such as Player, Enemy, or Bullet implement behavior here.
-        DebugLogger.trace(f"Update called (dt={dt:.4f})")
+        if Debug.TRACE_UPDATES:
+            DebugLogger.trace(f"Update called (dt={dt:.4f})")
 
     # ===========================================================
     # Rendering Hook
@@ -18,6 +18,8 @@ from src.core.utils.debug_logger import DebugLogger
 class Enemy(BaseEntity):
     """Base class providing shared logic for all enemy entities."""
 
+    __slots__ = ("speed", "hp", "_trace_timer")
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -51,15 +53,18 @@ class Enemy(BaseEntity):
             amount (int, optional): Amount of HP to subtract. Defaults to 1.
         """
         if not self.alive:
-            DebugLogger.trace("Damage ignored (already destroyed)")
+            if Debug.TRACE_UPDATES:
+                DebugLogger.trace("Damage ignored (already destroyed)")
             return
 
         self.hp -= amount
-        DebugLogger.state(f"HP reduced by {amount} → {self.hp}")
+        if Debug.VERBOSE_ENTITY_DAMAGE:
+            DebugLogger.state(f"HP reduced by {amount} → {self.hp}")
 
         if self.hp <= 0:
             self.alive = False
-            DebugLogger.state(f"Destroyed at {self.rect.topleft}")
+            if Debug.VERBOSE_ENTITY_DEATH:
+                DebugLogger.state(f"Destroyed at {self.rect.topleft}")
 
     # ===========================================================
     # Update Logic (To Be Overridden)
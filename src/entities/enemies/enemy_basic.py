@@ -17,6 +17,8 @@ from src.core.utils.debug_logger import DebugLogger
 class EnemyBasic(Enemy):
     """Basic enemy that moves vertically downward and loops back to top."""
 
+    __slots__ = ()
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -49,6 +49,10 @@ PLAYER_CONFIG = load_player_config()
 class Player(BaseEntity):
     """Represents the controllable player entity."""
 
+    # move_vec is assigned externally by GameScene each frame
+    __slots__ = ("pos", "velocity", "speed", "health", "invincible",
+                 "hitbox_scale", "move_vec")
+
     # ===========================================================
     # Initialization
     # ===========================================================
@@ -74,6 +78,7 @@ class Player(BaseEntity):
         # Player attributes
         self.pos = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
+        self.move_vec = pygame.Vector2(0, 0)  # Set by the scene each frame
         self.speed = cfg["speed"]
         self.health = cfg["health"]
         self.invincible = cfg["invincible"]
@@ -101,7 +106,7 @@ class Player(BaseEntity):
         if not self.alive:
             return
 
-        move_vec = getattr(self, "move_vec", pygame.Vector2(0, 0))
+        move_vec = self.move_vec
 
         # ==========================================================
         # Tunable Physics Parameters
@@ -28,6 +28,7 @@ class DrawManager:
         self.layers = {}  # {layer: [(surface, rect), ...]}
         self._layer_keys_cache = []
         self._layers_dirty = False
+        self._entity_types = set()  # Entity classes verified to expose image/rect
         DebugLogger.init("║{:<59}║".format(f"\t[DrawManager][INIT]\t\t→ Initialized"), show_meta=False)
 
 
@@ -51,12 +52,10 @@ class DrawManager:
             DebugLogger.warn(f"Missing image at {path}")
             img = pygame.Surface((40, 40))
             img.fill((255, 255, 255))
-            DebugLogger.warn(f"Missing image: {path}")
 
         if scale != 1.0:
             w, h = img.get_size()
             img = pygame.transform.scale(img, (int(w * scale), int(h * scale)))
-            print(f"[DrawManager] SCALE: '{key}' → {img.get_size()} ({scale}x)")
             DebugLogger.state(f"Scaled '{key}' to {img.get_size()} ({scale:.2f}x)")
 
         self.images[key] = img
@@ -110,9 +109,14 @@ class DrawManager:
     # Draw Queue Management
     # ===========================================================
     def clear(self):
-        """Clear the draw queue before a new frame."""
-        self.layers.clear()
-        self._layers_dirty = True
+        """
+        Clear the draw queue before a new frame.
+
+        Layer buckets are emptied in place and kept, so the sorted layer
+        order is only rebuilt when a new layer first appears.
+        """
+        for bucket in self.layers.values():
+            bucket.clear()
 
     def queue_draw(self, surface, rect, layer=0):
         """
@@ -135,11 +139,18 @@ class DrawManager:
         Args:
             entity: Object with `.image` and `.rect` attributes.
             layer (int): Rendering layer.
+
+        Notes:
+            The image/rect check runs once per entity class, not per call.
         """
-        if hasattr(entity, "image") and hasattr(entity, "rect"):
-            self.queue_draw(entity.image, entity.rect, layer)
-        else:
-            DebugLogger.warn(f"Invalid entity: {entity} (missing image/rect)")
+        entity_type = type(entity)
+        if entity_type not in self._entity_types:
+            if not (hasattr(entity, "image") and hasattr(entity, "rect")):
+                DebugLogger.warn(f"Invalid entity: {entity} (missing image/rect)")
+                return
+            self._entity_types.add(entity_type)
+
+        self.queue_draw(entity.image, entity.rect, layer)
 
     # ===========================================================
     # Rendering
@@ -159,10 +170,12 @@ class DrawManager:
             self._layer_keys_cache = sorted(self.layers.keys())
             self._layers_dirty = False
 
-        # Render each layer
+        # Render each layer (locals avoid repeated attribute lookups per blit)
+        layers = self.layers
+        blit = target_surface.blit
         for layer in self._layer_keys_cache:
-            for surface, rect in self.layers[layer]:
-                target_surface.blit(surface, (round(rect.x), round(rect.y)))
+            for surface, rect in layers[layer]:
+                blit(surface, rect)
 
         if debug:
             draw_count = sum(len(items) for items in self.layers.values())
@@ -24,6 +24,12 @@ class StartScene:
     def __init__(self, scene_manager):
         self.scene_manager = scene_manager
         self.timer = 0.0
+
+        # Placeholder background is static, so build it once
+        self.background = pygame.Surface((200, 80))
+        self.background.fill((0, 0, 0))
+        self.background_rect = self.background.get_rect(center=(640, 360))
+
         DebugLogger.init("║{:<57}║".format(f"\t\t└─ [StartScene][INIT]\t→ Initialized Starting Scene"), show_meta=False)
 
     # ===========================================================
@@ -67,6 +73,4 @@ class StartScene:
             draw_manager: DrawManager instance responsible for rendering.
         """
         # Draw a simple background or message
-        surf = pygame.Surface((200, 80))
-        surf.fill((0, 0, 0))
-        draw_manager.queue_draw(surf, surf.get_rect(center=(640, 360)), layer=0)
+        draw_manager.queue_draw(self.background, self.background_rect, layer=0)
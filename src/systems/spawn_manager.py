@@ -14,6 +14,13 @@ from src.core.settings import Debug
 from src.core.utils.debug_logger import DebugLogger
 from src.entities.enemies.enemy_basic import EnemyBasic
 
+# ===========================================================
+# Enemy Type Registry
+# ===========================================================
+# Maps type name → (image key, enemy class) for spawn dispatch.
+ENEMY_TYPES = {
+    "basic": ("enemy_basic", EnemyBasic),
+}
 
 class SpawnManager:
     """Central manager responsible for enemy spawning, updates, and rendering."""
@@ -50,13 +57,15 @@ class SpawnManager:
             x (float): X spawn coordinate.
             y (float): Y spawn coordinate.
         """
+        entry = ENEMY_TYPES.get(type_name)
+        if entry is None:
+            DebugLogger.warn(f"Unknown enemy type: '{type_name}'")
+            return
+
         try:
-            if type_name == "basic":
-                img = self.draw_manager.get_image("enemy_basic")
-                enemy = EnemyBasic(x, y, img)
-            else:
-                DebugLogger.warn(f"Unknown enemy type: '{type_name}'")
-                return
+            image_key, enemy_class = entry
+            img = self.draw_manager.get_image(image_key)
+            enemy = enemy_class(x, y, img)
 
             self.enemies.append(enemy)
             if Debug.VERBOSE_ENTITY_INIT:
@@ -76,17 +85,18 @@ class SpawnManager:
         Args:
             dt (float): Delta time since last frame (in seconds).
         """
-        if not self.enemies:
+        enemies = self.enemies
+        if not enemies:
             return
 
         # Update all enemies
-        for enemy in self.enemies:
+        for enemy in enemies:
             enemy.update(dt)
 
         # Remove dead enemies efficiently
-        initial_count = len(self.enemies)
-        self.enemies = [e for e in self.enemies if e.alive]
-        removed_count = initial_count - len(self.enemies)
+        initial_count = len(enemies)
+        self.enemies = enemies = [e for e in enemies if e.alive]
+        removed_count = initial_count - len(enemies)
 
         if removed_count > 0 and Debug.VERBOSE_ENTITY_DEATH:
             DebugLogger.state(f"Removed {removed_count} inactive enemies")
@@ -98,6 +108,7 @@ class SpawnManager:
         """
         Render all active enemies using the global DrawManager.
         """
+        draw_manager = self.draw_manager
         for e in self.enemies:
-            e.draw(self.draw_manager)
+            e.draw(draw_manager)
         # No per-frame logging here to avoid console spam
@@ -28,6 +28,9 @@ class StageManager:
         """
         self.spawner = spawner
         self.stage_data = sorted(stage_data, key=lambda w: w["spawn_time"])
+        # Parallel tuple of spawn times so the per-frame check skips dict lookups
+        self._spawn_times = tuple(w["spawn_time"] for w in self.stage_data)
+        self._wave_count = len(self._spawn_times)
         self.stage_timer = 0.0
         self.wave_index = 0
         self.stage_active = True
@@ -50,14 +53,14 @@ class StageManager:
         self.stage_timer += dt
 
         # Process scheduled waves
-        while (self.wave_index < len(self.stage_data) and
-               self.stage_timer >= self.stage_data[self.wave_index]["spawn_time"]):
+        while (self.wave_index < self._wave_count and
+               self.stage_timer >= self._spawn_times[self.wave_index]):
             wave = self.stage_data[self.wave_index]
             self._trigger_wave(wave)
             self.wave_index += 1
 
         # End condition: all waves spawned and all enemies cleared
-        if self.wave_index >= len(self.stage_data) and not self.spawner.enemies:
+        if self.wave_index >= self._wave_count and not self.spawner.enemies:
             self.stage_active = False
             DebugLogger.state("Stage complete — all waves cleared")
 
@@ -79,8 +82,6 @@ class StageManager:
 
         width = self.spawner.display.get_window_size()[0] if self.spawner.display else 800
 
-        DebugLogger.system(f"Triggering wave: {wave}")
-
         DebugLogger.system(f"Triggering wave {self.wave_index + 1}: {enemy_type} ×{count} ({pattern})")
 
         # Basic formation patterns
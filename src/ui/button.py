@@ -67,12 +67,17 @@ class Button(UIElement):
         # Button state
         self.is_hovered = False
         self.is_pressed = False
+        self._last_mouse = None  # skip hit-testing while the mouse is still
 
         self.hover_t = 0.0  # transition progress (0–1)
         self.transition_speed = 8.0  # higher = faster fade
 
         self.draw_manager = None
 
+        # Last rendered surface and the visual state it was built from
+        self._surface_cache = None
+        self._surface_key = None
+
         # DebugLogger.system(f"Initialized at ({x}, {y}) with action '{action}'")
 
     # ===========================================================
@@ -88,10 +93,13 @@ class Button(UIElement):
         if not self.enabled:
             self.is_hovered = False
             self.is_pressed = False
+            self._last_mouse = None
             return
 
         was_hovered = self.is_hovered
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        if mouse_pos != self._last_mouse:
+            self._last_mouse = mouse_pos
+            self.is_hovered = self.rect.collidepoint(mouse_pos)
 
         # Smooth hover interpolation (fade-in/out)
         target = 1.0 if self.is_hovered else 0.0
@@ -132,9 +140,11 @@ class Button(UIElement):
 
         Returns:
             pygame.Surface: The rendered button surface.
-        """
-        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
 
+        Notes:
+            The surface is cached and reused until the resolved color,
+            size, border, or icon changes.
+        """
         # Determine color based on state
         if not self.enabled:
             color = (80, 80, 80)
@@ -143,6 +153,13 @@ class Button(UIElement):
         else:
             color = self._lerp_color(self.color, self.hover_color, self.hover_t)
 
+        key = (color, self.rect.size, self.border_color, self.border_width,
+               self.icon_type, self.draw_manager is not None)
+        if key == self._surface_key:
+            return self._surface_cache
+
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
         # Background
         pygame.draw.rect(surf, color, surf.get_rect())
 
@@ -160,6 +177,8 @@ class Button(UIElement):
                 self._draw_icon(surf, self.icon_type, self.border_color)
 
         # DebugLogger.state(f"Rendered '{self.action}' at {self.rect.topleft}")
+        self._surface_cache = surf
+        self._surface_key = key
         return surf
 
     # ===========================================================
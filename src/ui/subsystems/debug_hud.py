@@ -37,6 +37,10 @@ class DebugHUD:
         self.visible = False
         self._last_visibility = self.visible
 
+        # Font is built once; SysFont lookups are too costly to run per frame
+        self.font = pygame.font.SysFont("consolas", 18)
+        self._text_cache = {}  # {slot: (text, surface)}
+
         self._create_elements()
 
         DebugLogger.init("║{:<59}║".format(f"\t[DEBUGHUD][INIT]\t→ Initialized"), show_meta=False)
@@ -172,12 +176,11 @@ class DebugHUD:
         # --------------------------------------------------------
         player = settings.GLOBAL_PLAYER
         if player:
-            font = pygame.font.SysFont("consolas", 18)
             pos_text = f"Pos: ({player.rect.x:.1f}, {player.rect.y:.1f})"
             vel_text = f"Vel: ({player.velocity.x:.2f}, {player.velocity.y:.2f})"
 
-            surface_pos = font.render(pos_text, True, (255, 255, 255))
-            surface_vel = font.render(vel_text, True, (255, 255, 255))
+            surface_pos = self._render_text("pos", pos_text)
+            surface_vel = self._render_text("vel", vel_text)
 
             # Display near the top-left corner
             rect_pos = surface_pos.get_rect(topleft=(70, 20))
@@ -186,6 +189,25 @@ class DebugHUD:
             draw_manager.queue_draw(surface_pos, rect_pos, Layers.UI)
             draw_manager.queue_draw(surface_vel, rect_vel, Layers.UI)
 
+    def _render_text(self, slot, text):
+        """
+        Render a line of debug text, reusing the last surface if unchanged.
+
+        Args:
+            slot (str): Identifier for the text line (e.g., 'pos', 'vel').
+            text (str): Text to display.
+
+        Returns:
+            pygame.Surface: The rendered text surface.
+        """
+        cached = self._text_cache.get(slot)
+        if cached and cached[0] == text:
+            return cached[1]
+
+        surface = self.font.render(text, True, (255, 255, 255))
+        self._text_cache[slot] = (text, surface)
+        return surface
+
     # ===========================================================
     # Visibility Controls
     # ===========================================================